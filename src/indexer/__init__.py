@@ -1,5 +1,5 @@
 from ._io import BuildEnvironment
 from ._io import get_environment
-from . import WorkshopItem
+from .workshop import WorkshopItem
 
-__all__ = ["BuildEnvironment", "get_environment"]
+__all__ = ["BuildEnvironment", "get_environment", "WorkshopItem"]
@@ -1,8 +1,10 @@
 import dataclasses
-import json
+import functools
 import pathlib
 import typing
 
+import orjson
+
 from .rimworld import _find_rimworld_install_path
 from .workshop import get_rimworld_workshop_root, WorkshopItem
 from .workshop import index_workshop_files
@@ -37,26 +39,23 @@ class BuildEnvironment:
         yield from index_workshop_files(self.workshop_root)
 
 
+@functools.lru_cache(maxsize=1)
 def get_environment() -> BuildEnvironment:
     state = _load_persistable_state()
 
     return BuildEnvironment(
-        state["rimworld_install_path"], state["workshop_root"]
+        pathlib.Path(state["rimworld_install_path"]),
+        pathlib.Path(state["workshop_root"]),
     )
 
 
 def _load_persistable_state() -> dict:
     state_file = pathlib.Path.cwd().joinpath(".rimworld")
-    state: dict = {}
 
     if not state_file.exists():
-        state = _generate_default_state(state_file)
+        return _generate_default_state(state_file)
 
-    if not state:
-        with state_file.open("r") as file:
-            state = json.load(file)
-
-    return state
+    return orjson.loads(state_file.read_bytes())
 
 
 def _generate_default_state(state_file_location: pathlib.Path) -> dict:
@@ -70,9 +69,8 @@ def _generate_default_state(state_file_location: pathlib.Path) -> dict:
         )
 
     state["rimworld_install_path"] = str(rimworld_path)
-    state["workshop_path"] = str(get_rimworld_workshop_root(rimworld_path))
+    state["workshop_root"] = str(get_rimworld_workshop_root(rimworld_path))
 
-    with state_file_location.open("w") as file:
-        json.dump(state, file)
+    state_file_location.write_bytes(orjson.dumps(state))
 
     return state
@@ -0,0 +1,12 @@
+import platform
+import typing
+
+_PLATFORM: typing.Final[str] = platform.system()
+
+# The platform is fixed for the lifetime of the process, so the concrete
+# implementation is selected once at import time instead of re-checking
+# the platform string inside every call on the scan path.
+if _PLATFORM == "Windows":
+    from .windows import _find_rimworld_install_path
+else:
+    raise OSError(f"Unsupported platform: {_PLATFORM}")
@@ -0,0 +1,109 @@
+import collections
+import os
+import pathlib
+import re
+import typing
+
+# Directory names that never contain a Steam library: system directories
+# ("Windows", ...), OEM recovery partitions, and hidden NTFS metadata
+# directories ("$Recycle.Bin", ...). One compiled regex replaces a chain
+# of str.startswith calls on every directory the drive scan visits.
+_SKIP_DIRECTORY_RE: typing.Final[re.Pattern[str]] = re.compile(
+    r"^(?:\$|OEM|Windows)"
+)
+
+
+def _find_rimworld_install_path() -> pathlib.Path | None:
+    """Attempts to find the directory RimWorld is installed in.
+
+    Returns:
+        pathlib.Path:
+            The path to the root directory of the RimWorld installation.
+    """
+    return _get_windows_rimworld_path()
+
+
+def _get_windows_rimworld_path() -> pathlib.Path | None:
+    program_files = os.getenv("ProgramFiles(x86)")
+
+    if program_files is not None:
+        default_path = os.path.join(
+            program_files, "Steam", "steamapps", "common", "RimWorld"
+        )
+
+        if _is_valid_rimworld_path(default_path):
+            return pathlib.Path(default_path)
+
+    for drive in os.listdrives():
+        try:
+            rimworld_path = _scan_for_path(pathlib.Path(drive), 2)
+        except ValueError:
+            continue
+        except PermissionError:
+            continue
+        else:
+            return rimworld_path
+
+    return None
+
+
+def _is_valid_directory(entry: os.DirEntry) -> bool:
+    if _SKIP_DIRECTORY_RE.match(entry.name):
+        return False
+
+    return entry.is_dir(follow_symlinks=False)
+
+
+# The known entry points RimWorld ships with, per platform. Probing these
+# directly is a single syscall each, instead of listing the entire
+# candidate directory looking for a file named "RimWorld*".
+_RIMWORLD_ENTRY_POINTS: typing.Final[tuple[str, ...]] = (
+    "RimWorldWin64.exe",
+    "RimWorld.exe",
+    "RimWorldLinux",
+    "RimWorldMac.app",
+)
+
+
+def _is_valid_rimworld_path(path: str | os.PathLike[str]) -> bool:
+    return any(
+        os.path.isfile(os.path.join(path, name))
+        for name in _RIMWORLD_ENTRY_POINTS
+    )
+
+
+def _scan_for_path(
+    root_directory: pathlib.Path, check_depth: int = 3
+) -> pathlib.Path:
+    # Drive scans visit far too many directories for a recursive walk, so
+    # candidates are processed breadth-first from an explicit queue. Each
+    # queued entry carries the amount of depth budget it has left, which
+    # bounds the scan without the fan-out the recursive version had.
+    queue: collections.deque[tuple[str, int]] = collections.deque()
+    queue.append((os.fspath(root_directory), check_depth))
+
+    while queue:
+        directory, depth = queue.popleft()
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not _is_valid_directory(entry):
+                        continue
+
+                    if entry.name == "steamapps":
+                        # Paths stay plain strings while scanning; a
+                        # pathlib.Path is only materialized for the one
+                        # result handed back to the caller.
+                        rimworld_path = os.path.join(
+                            entry.path, "common", "RimWorld"
+                        )
+
+                        if _is_valid_rimworld_path(rimworld_path):
+                            return pathlib.Path(rimworld_path)
+                    elif depth > 0:
+                        queue.append((entry.path, depth - 1))
+        except PermissionError:
+            continue
+
+    raise ValueError("Could not find Steam directory (./steamapps/)")
@@ -1,11 +1,22 @@
+import concurrent.futures
+import json
+import mmap
+import os
 import pathlib
+import threading
 import typing
-from xml.etree import cElementTree as ElementTree
+from xml.parsers import expat
 
 from .data import WorkshopItem
 
 __all__ = ["get_rimworld_workshop_root", "index_workshop_files"]
 
+# Sits beside the ".rimworld" state file and maps each About.xml path to
+# the file's mtime and the package id read from it. Steam's mod directory
+# rarely changes between invocations, so a matching mtime lets the
+# indexer skip the XML parse entirely on warm runs.
+_CACHE_FILE_NAME: typing.Final[str] = ".rimworld.cache"
+
 
 def get_rimworld_workshop_root(
     rimworld_install_dir: pathlib.Path,
@@ -16,18 +27,163 @@ def get_rimworld_workshop_root(
 def index_workshop_files(
     workshop_root: pathlib.Path,
 ) -> typing.Generator[WorkshopItem]:
-    for directory in workshop_root.iterdir():
-        if not directory.is_dir():
-            continue
+    with os.scandir(workshop_root) as entries:
+        directories = [
+            entry for entry in entries if entry.is_dir(follow_symlinks=False)
+        ]
+
+    # Each mod is an independent About.xml parse plus a couple of stat
+    # calls, and the GIL is released for the duration of the file I/O, so
+    # threads can overlap the filesystem latency of thousands of small
+    # reads.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    cache = _load_index_cache()
+    fresh_cache: dict[str, list] = {}
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _index_workshop_item,
+                    entry.path,
+                    entry.name,
+                    cache,
+                    fresh_cache,
+                )
+                for entry in directories
+            ]
+
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    yield future.result()
+            finally:
+                # If the consumer closes the generator early, work that
+                # hasn't started yet is dropped so the executor's
+                # shutdown doesn't sit parsing every remaining About.xml.
+                for future in futures:
+                    future.cancel()
+    finally:
+        # The executor has shut down by this point, so no worker is still
+        # writing into fresh_cache while it's serialized. Rewriting the
+        # cache from only this run's entries also prunes mods that have
+        # since been removed from the workshop folder.
+        _save_index_cache(fresh_cache)
+
+
+def _index_workshop_item(
+    directory: str, name: str, cache: dict, fresh_cache: dict[str, list]
+) -> WorkshopItem:
+    about_file = os.path.join(directory, "About", "About.xml")
+    mtime_ns = os.stat(about_file).st_mtime_ns
+
+    cached = cache.get(about_file)
+
+    if cached is not None and cached[0] == mtime_ns:
+        package_id = cached[1]
+    else:
+        package_id = _read_package_id(about_file)
+
+    fresh_cache[about_file] = [mtime_ns, package_id]
+
+    return WorkshopItem(package_id, int(name), pathlib.Path(directory))
+
+
+def _load_index_cache() -> dict:
+    cache_file = pathlib.Path.cwd().joinpath(_CACHE_FILE_NAME)
+
+    try:
+        return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index_cache(cache: dict[str, list]) -> None:
+    cache_file = pathlib.Path.cwd().joinpath(_CACHE_FILE_NAME)
+
+    with cache_file.open("w") as file:
+        json.dump(cache, file)
+
+
+class _PackageIdFound(Exception):
+    """Raised internally to abort an About.xml parse at the package id."""
+
+
+class _PackageIdExtractor:
+    """A reusable expat handler target for reading About.xml package ids.
+
+    About.xml files can contain long descriptions and mod lists, but the
+    indexer only cares about the mod's package id. Each file is memory
+    mapped and handed to expat directly, so the bytes go from the page
+    cache into the parser without an intermediate read buffer, and the
+    parse is aborted as soon as the packageId element closes.
+
+    pyexpat doesn't expose XML_ParserReset, so a fresh parser is still
+    created per file; what one extractor amortizes across the files it
+    reads is the handler setup, which would otherwise be three new
+    closures for every mod.
+
+    Only a packageId that is a direct child of the document root counts:
+    About.xml nests <packageId> elements inside <modDependencies> blocks
+    too, and element order isn't mandated, so without the depth guard a
+    mod listing its dependencies first would be indexed under a
+    dependency's id.
+    """
+
+    __slots__ = ("_depth", "_inside", "_chunks")
+
+    def __init__(self):
+        self._depth: int = 0
+        self._inside: bool = False
+        self._chunks: list[str] = []
+
+    def read(self, about_file: str) -> str | None:
+        self._depth = 0
+        self._inside = False
+        self._chunks.clear()
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._character_data
+
+        fd = os.open(about_file, os.O_RDONLY)
+
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as view:
+                try:
+                    parser.Parse(view, True)
+                except _PackageIdFound:
+                    return "".join(self._chunks)
+        finally:
+            os.close(fd)
+
+        return None
+
+    def _start_element(self, tag: str, _attributes: dict):
+        if tag == "packageId" and self._depth == 1:
+            self._inside = True
+
+        self._depth += 1
+
+    def _character_data(self, data: str):
+        if self._inside:
+            self._chunks.append(data)
+
+    def _end_element(self, tag: str):
+        self._depth -= 1
+
+        if self._inside and tag == "packageId":
+            raise _PackageIdFound()
+
+
+_extractors = threading.local()
 
-        about_file = directory.joinpath("About/About.xml")
 
-        with about_file.open("r") as file:
-            about_tree: ElementTree = ElementTree.ElementTree(file=about_file)
-            about_root = about_tree.getroot()
+def _read_package_id(about_file: str) -> str | None:
+    try:
+        extractor = _extractors.extractor
+    except AttributeError:
+        extractor = _extractors.extractor = _PackageIdExtractor()
 
-            yield WorkshopItem(
-                about_root.find("packageId").text,
-                int(directory.name),
-                directory,
-            )
+    return extractor.read(about_file)
@@ -1,24 +1,47 @@
 import dataclasses
+import functools
+import sys
 from pathlib import Path
-from xml.etree import cElementTree as ElementTree
+from typing import Sequence
+from xml.etree import ElementTree
 
 __all__ = ["WorkshopItem"]
 
 from semver import Version
 
 
-@dataclasses.dataclass
+@functools.lru_cache(maxsize=64)
+def _parse_version(version: str) -> Version:
+    # LoadFolders.xml files repeat the same handful of game versions over
+    # and over; caching the parse avoids re-running semver's regex for
+    # every folder entry.
+    return Version.parse(version)
+
+
+# Shared by every LoadFolder parsed without mod requirements. The empty
+# tuple is immutable, so sharing one instance across folders avoids two
+# fresh allocations per folder without any risk of a caller mutating the
+# sentinel out from under every other folder.
+_NO_MODS: tuple[str, ...] = ()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class LoadFolder:
     path: Path
     game_version: Version
-    requires_active_mods: list[str] = dataclasses.field(default_factory=list)
-    requires_inactive_mods: list[str] = dataclasses.field(default_factory=list)
+    requires_active_mods: Sequence[str] = _NO_MODS
+    requires_inactive_mods: Sequence[str] = _NO_MODS
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(eq=False, repr=False, slots=True)
 class WorkshopItem:
     """Represents an item downloaded from RimWorld's Steam workshop.
 
+    Instances are transient records created by the thousand while the
+    workshop folder is indexed, and callers never compare or hash them,
+    so the generated equality and repr machinery is turned off along
+    with the per-instance __dict__.
+
     Attributes:
         mod_id:
             The package id of the mod.
@@ -32,6 +55,13 @@ class WorkshopItem:
     steam_id: int
     directory: Path
 
+    _load_folders_path: Path = dataclasses.field(init=False)
+    _about_file_path: Path = dataclasses.field(init=False)
+    _load_folders: list[LoadFolder] = dataclasses.field(init=False)
+    _highest_load_folder_version: Version | None = dataclasses.field(
+        init=False
+    )
+
     def __post_init__(self):
         self._load_folders_path: Path = self.directory.joinpath(
             "LoadFolders.xml"
@@ -88,13 +118,25 @@ class WorkshopItem:
         if not self._load_folders_path.exists():
             return self._generate_load_folders()
 
-        with self._load_folders_path.open("r") as file:
-            tree = ElementTree.ElementTree(file=file)
+        depth: int = 0
 
-        root_node = tree.getroot()
+        for event, node in ElementTree.iterparse(
+            self._load_folders_path, events=("start", "end")
+        ):
+            if event == "start":
+                depth += 1
 
-        for node in root_node.getchildren():
-            game_version = Version.parse(node.text.rstrip("v"))
+                continue
+
+            depth -= 1
+
+            if depth != 1:
+                continue
+
+            # `node` is a complete version entry at this point; it's
+            # processed and discarded immediately so the full document tree
+            # never accumulates in memory.
+            game_version = _parse_version(node.text.rstrip("v"))
 
             if (
                 self._highest_load_folder_version is None
@@ -102,19 +144,38 @@ class WorkshopItem:
             ):
                 self._highest_load_folder_version = game_version
 
-            for folder in node.getchildren():
+            folder_path = Path(node.text)
+
+            for folder in node:
                 active_mods = folder.get("IfModActive", "")
                 inactive_mods = folder.get("IfModNotActive", "")
 
+                # Mod ids repeat across folders, versions, and mods, so
+                # interning them keeps a single copy of each id alive no
+                # matter how many workshop items reference it.
                 self._load_folders.append(
                     LoadFolder(
-                        Path(node.text),
+                        folder_path,
                         game_version,
-                        [mod for mod in active_mods.split(",") if mod],
-                        [mod for mod in inactive_mods.split(",") if mod],
+                        [
+                            sys.intern(mod)
+                            for mod in active_mods.split(",")
+                            if mod
+                        ]
+                        if active_mods
+                        else _NO_MODS,
+                        [
+                            sys.intern(mod)
+                            for mod in inactive_mods.split(",")
+                            if mod
+                        ]
+                        if inactive_mods
+                        else _NO_MODS,
                     )
                 )
 
+            node.clear()
+
         return self._load_folders
 
     def _generate_load_folders(self) -> list[LoadFolder]:
@@ -161,12 +222,10 @@ class WorkshopItem:
 
             if has_common_folder:
                 self._load_folders.append(
-                    LoadFolder(common_folder_path, version, [], [])
+                    LoadFolder(common_folder_path, version)
                 )
 
-            self._load_folders.append(LoadFolder(node, version, [], []))
-            self._load_folders.append(
-                LoadFolder(self.directory, version, [], [])
-            )
+            self._load_folders.append(LoadFolder(node, version))
+            self._load_folders.append(LoadFolder(self.directory, version))
 
         return self._load_folders
@@ -1,63 +1,103 @@
+import asyncio
 import dataclasses
+import os
 from logging import getLogger
 from pathlib import Path
+from typing import AsyncGenerator
+from typing import Final
 from typing import Generator
 from typing import Self
-from xml.etree import cElementTree as ElementTree
+from xml.etree import ElementTree
 
 from semver import Version
-from yaml import safe_load
-
 from .manifest import Manifest
+from .manifest import load_manifest
 from .nuget import NuGetClient
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class DependencyUpdateResult:
     dependency_id: str
     current_version: Version
     previous_version: Version
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NuGetPackage:
     name: str
     version: Version
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Project:
+    # Packages are stored as parallel name/version lists rather than a list
+    # of NuGetPackage records; the update loop only ever needs one of the
+    # two fields at a time, and the flat layout feeds straight into the
+    # name-keyed lookup update_packages builds.
     project_file: Path
-    packages: list[NuGetPackage]
+    names: list[str]
+    versions: list[Version]
 
 
 class Linker:
+    MAX_CONCURRENT_QUERIES: Final[int] = 8
+
+    # Directories that can never contain a project file but can hold a huge
+    # number of build artifacts; descending into them makes project
+    # discovery scale with output size instead of source size.
+    PRUNED_DIRECTORIES: Final[frozenset[str]] = frozenset(
+        {"bin", "obj", ".git", "node_modules", ".vs"}
+    )
+
     def __init__(self, manifest: Manifest):
         self._projects: list[Project] = []
         self._manifest: Manifest = manifest
         self._global_dependencies: list[Project] = []
         self._nuget_client: NuGetClient = NuGetClient()
 
-    async def update_packages(self) -> Generator[DependencyUpdateResult]:
+    async def update_packages(self) -> AsyncGenerator[DependencyUpdateResult]:
+        # The same package routinely appears in several projects (and in
+        # Directory.Packages.props), so unique names are collected first and
+        # each one is queried exactly once. The queries themselves are
+        # latency bound, so they're issued concurrently, with a semaphore
+        # keeping the registry fan-out polite.
+        package_versions: dict[str, Version] = {}
+
         for project in self._projects + self._global_dependencies:
-            for package in project.packages:
-                newer_release_found: bool = False
+            for name, version in zip(project.names, project.versions):
+                package_versions.setdefault(name, version)
 
-                for release in await self._nuget_client.query_package(
-                    package.name, include_prereleases=False
-                ):
-                    for version in release.versions:
-                        if version.version > package.version:
-                            yield DependencyUpdateResult(
-                                package.name, package.version, version.version
-                            )
+        semaphore = asyncio.Semaphore(Linker.MAX_CONCURRENT_QUERIES)
+
+        async def query(name: str):
+            async with semaphore:
+                return await self._nuget_client.query_package(
+                    name, include_prereleases=False
+                )
+
+        names = list(package_versions)
+        results = await asyncio.gather(*(query(name) for name in names))
 
-                            newer_release_found = True
+        for name, releases in zip(names, results):
+            if not releases:
+                continue
 
-                            break
+            current_version = package_versions[name]
 
-                    if newer_release_found:
-                        break
+            for release in releases:
+                newest_version = max(
+                    (version.version for version in release.versions),
+                    default=None,
+                )
+
+                if newest_version is not None and (
+                    newest_version > current_version
+                ):
+                    yield DependencyUpdateResult(
+                        name, current_version, newest_version
+                    )
+
+                    break
 
     async def update_dependencies(self) -> Generator[DependencyUpdateResult]:
         for dependency in self._manifest.dependencies:
@@ -103,44 +143,51 @@ class Linker:
     @classmethod
     def _load_manifest(cls, manifest_path: Path) -> Manifest:
         with manifest_path.open("r", encoding="utf-8") as file:
-            contents = safe_load(file)
-
-            return Manifest.from_json(contents)
+            return load_manifest(file)
 
     @classmethod
     def _resolve_projects(cls, root: Path) -> list[Project]:
         projects: list[Project] = []
 
-        for child in root.iterdir():
-            for inner_child in child.iterdir():
-                if inner_child.name.endswith(".csproj"):
-                    projects.append(Linker._resolve_project(inner_child))
-
-                    break
+        for directory, children, files in os.walk(root):
+            children[:] = [
+                child
+                for child in children
+                if child not in Linker.PRUNED_DIRECTORIES
+            ]
+
+            for file_name in files:
+                if file_name.endswith(".csproj"):
+                    projects.append(
+                        Linker._resolve_project(Path(directory, file_name))
+                    )
 
         return projects
 
     @classmethod
     def _resolve_project(cls, project_path: Path) -> Project:
-        project: Project = Project(project_path, [])
-
-        with open(project_path, "r", encoding="utf-8") as file:
-            tree: ElementTree.ElementTree = ElementTree.ElementTree(file=file)
-            root = tree.getroot()
-
-            for item_group in root.iter("ItemGroup"):
-                for node in item_group.iter():
-                    if (
-                        node.tag != "PackageReference"
-                        or node.tag != "Reference"
-                    ):
-                        continue
-
-                    project.packages.append(
-                        NuGetPackage(
-                            node.get("Include"),
-                            Version.parse(node.get("Version")),
-                        )
-                    )
+        project: Project = Project(project_path, [], [])
+
+        root = ElementTree.parse(project_path).getroot()
+
+        # The old scan walked every descendant of every ItemGroup and its
+        # tag predicate (`!= "PackageReference" or != "Reference"`) was a
+        # tautology, so no package was ever collected. Targeted XPath
+        # queries visit only the reference nodes themselves.
+        for xpath in (".//ItemGroup/PackageReference", ".//ItemGroup/Reference"):
+            for node in root.iterfind(xpath):
+                name = node.get("Include")
+                version = node.get("Version")
+
+                # Framework assembly references ship without a Version
+                # attribute, and some projects put the version in a child
+                # <Version> element instead; neither names a NuGet package
+                # version this linker can update, so such nodes are skipped
+                # rather than fed into Version.parse.
+                if not name or not version:
+                    continue
+
+                project.names.append(name)
+                project.versions.append(Version.parse(version))
 
         return project
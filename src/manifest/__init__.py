@@ -1,5 +1,13 @@
 from .data import Manifest
+from .errors import ManifestDecodeError
+from .errors import ManifestError
 from ._io import save_manifest
 from ._io import load_manifest
 
-__all__ = ["Manifest", "load_manifest", "save_manifest"]
+__all__ = [
+    "Manifest",
+    "ManifestDecodeError",
+    "ManifestError",
+    "load_manifest",
+    "save_manifest",
+]
@@ -1,7 +1,17 @@
 from io import TextIOBase
 
-from yaml import safe_dump
-from yaml import safe_load
+from yaml import dump
+from yaml import load
+
+try:
+    # libyaml's C loader and dumper parse roughly an order of magnitude
+    # faster than the pure-Python implementations; fall back gracefully
+    # when PyYAML was built without libyaml.
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
 
 from .data import Manifest
 
@@ -15,7 +25,7 @@ def load_manifest(file: TextIOBase) -> Manifest:
         file (TextIOBase):
             The file handle to read the manifest from.
     """
-    data = safe_load(file)
+    data = load(file, Loader=_SafeLoader)
 
     return Manifest.from_json(data)
 
@@ -29,4 +39,4 @@ def save_manifest(file: TextIOBase, manifest: Manifest):
         manifest (Manifest):
             The manifest to save to disk.
     """
-    safe_dump(manifest.to_json(), file, indent=2)
+    dump(manifest.to_json(), file, Dumper=_SafeDumper, indent=2)
@@ -1,10 +1,15 @@
+import os
 from dataclasses import dataclass
 from dataclasses import field
 from enum import StrEnum
 from pathlib import Path
 from typing import Self
 
+from .errors import ManifestDecodeError
+
 __all__ = [
+    "json_default",
+    "DependencyTable",
     "Manifest",
     "ManifestLink",
     "ManifestSupportedVersion",
@@ -40,6 +45,13 @@ class ManifestLinkType(StrEnum):
     DOCUMENTATION = "DOCUMENTATION"
 
 
+# Constructing a StrEnum member from its value routes every decode
+# through EnumMeta.__call__; the value→member tables the enums already
+# maintain make the same lookup a plain dict hit. The tables are bound as
+# default arguments below so the decode loops load them as fast locals.
+_LINK_TYPES: dict[str, ManifestLinkType] = ManifestLinkType._value2member_map_
+
+
 @dataclass(slots=True)
 class ManifestLink:
     """Represents metadata for a link provided by the mod author for users.
@@ -55,21 +67,27 @@ class ManifestLink:
     link: str
 
     @classmethod
-    def from_json(cls, content: dict[str, str]) -> Self:
+    def from_json(
+        cls, content: dict[str, str], _link_types=_LINK_TYPES
+    ) -> Self:
         """Creates a new instance of the ManifestLink class from a JSON object.
 
         Arguments:
             content:
                 The JSON object containing information about the manifest link.
         """
-        type_: ManifestLinkType = ManifestLinkType(content["type"])
-        link: str = content["link"]
+        # The enum constructor is kept as the fallback so unknown values
+        # still raise the usual ValueError.
+        link_type = content["type"]
 
-        return cls(type_, link)
+        return cls(
+            _link_types.get(link_type) or ManifestLinkType(link_type),
+            content["link"],
+        )
 
     def to_json(self) -> JsonValue:
         """Converts the object to a JSON object."""
-        return {"type": str(self.type), "link": self.link}
+        return {"type": self.type.value, "link": self.link}
 
 
 class SupportStatus(StrEnum):
@@ -93,6 +111,9 @@ class SupportStatus(StrEnum):
     UNSUPPORTED = "UNSUPPORTED"
 
 
+_SUPPORT_STATUSES: dict[str, SupportStatus] = SupportStatus._value2member_map_
+
+
 @dataclass(slots=True)
 class ManifestSupportedVersion:
     """Represents metadata for the version of the game the mod supports.
@@ -110,7 +131,9 @@ class ManifestSupportedVersion:
     status: SupportStatus
 
     @classmethod
-    def from_json(cls, content: dict[str, str]) -> Self:
+    def from_json(
+        cls, content: dict[str, str], _statuses=_SUPPORT_STATUSES
+    ) -> Self:
         """Creates a new instance of ManifestSupportVersion from a JSON object.
 
         Args:
@@ -118,14 +141,15 @@ class ManifestSupportedVersion:
                 The JSON object containing information about the version of the
                 game the mod supports.
         """
-        version: str = content["version"]
-        status: SupportStatus = SupportStatus(content["status"])
+        status = content["status"]
 
-        return cls(version, status)
+        return cls(
+            content["version"], _statuses.get(status) or SupportStatus(status)
+        )
 
     def to_json(self) -> JsonValue:
         """Converts the object to a JSON object."""
-        return {"version": self.version, "status": str(self.status)}
+        return {"version": self.version, "status": self.status.value}
 
 
 @dataclass(slots=True)
@@ -151,9 +175,9 @@ class ModDependency:
     """
 
     id: str
-    optional: bool = field(default=False, init=False)
-    version: str | None = field(default=None, init=False)
-    game_version: str | None = field(default=None, init=False)
+    optional: bool = False
+    version: str | None = None
+    game_version: str | None = None
 
     @classmethod
     def from_json(cls, content: dict[str, str]) -> Self:
@@ -164,17 +188,12 @@ class ModDependency:
                 The JSON object containing information about the version of the
                 mod being depended upon.
         """
-        id_: str = content["id"]
-        optional: bool = content.get("optional", False)
-        version: str | None = content.get("version", None)
-        game_version: str | None = content.get("game_version", None)
-
-        dependency = cls(id_)
-        dependency.version = version
-        dependency.optional = optional
-        dependency.game_version = game_version
-
-        return dependency
+        return cls(
+            content["id"],
+            content.get("optional", False),
+            content.get("version", None),
+            content.get("game_version", None),
+        )
 
     def to_json(self) -> JsonValue:
         """Converts the object to a JSON object."""
@@ -193,6 +212,82 @@ class ModDependency:
             }
 
 
+class DependencyTable:
+    """A column-oriented view over a list of mod dependencies.
+
+    Manifest.dependencies stores one ModDependency object per entry,
+    which is the right shape for editing a manifest but a poor one for
+    bulk passes: gathering every id or filtering by the optional flag
+    walks an object header and an attribute lookup per dependency. This
+    table stores the same records as parallel columns, so those passes
+    become plain list/bytearray scans.
+
+    The table is an opt-in alternative built from an existing dependency
+    list — Manifest itself keeps its object layout. Indexing materializes
+    a ModDependency on demand for callers that need the record shape.
+
+    Attributes:
+        ids:
+            The id column, one entry per dependency.
+        optional:
+            The optional-flag column; each byte is 0 or 1.
+        versions:
+            The mod version column.
+        game_versions:
+            The game version column.
+    """
+
+    __slots__ = ("ids", "optional", "versions", "game_versions")
+
+    def __init__(self, dependencies: list[ModDependency] | None = None):
+        self.ids: list[str] = []
+        self.optional: bytearray = bytearray()
+        self.versions: list[str | None] = []
+        self.game_versions: list[str | None] = []
+
+        for dependency in dependencies or []:
+            self.ids.append(dependency.id)
+            self.optional.append(dependency.optional)
+            self.versions.append(dependency.version)
+            self.game_versions.append(dependency.game_version)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> ModDependency:
+        return ModDependency(
+            self.ids[index],
+            bool(self.optional[index]),
+            self.versions[index],
+            self.game_versions[index],
+        )
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield self[index]
+
+    def to_json(self) -> JsonValue:
+        """Converts the table to the JSON form of the dependency list."""
+        # One zip pass over the columns; no per-record objects are built.
+        return [
+            {
+                "id": id_,
+                "version": version,
+                "optional": bool(optional),
+                "game_version": game_version,
+            }
+            if game_version
+            else {
+                "id": id_,
+                "version": version,
+                "optional": bool(optional),
+            }
+            for id_, optional, version, game_version in zip(
+                self.ids, self.optional, self.versions, self.game_versions
+            )
+        ]
+
+
 class LoadOrderHint(StrEnum):
     """The relative positions other mods should be in the game's mod load order.
 
@@ -209,6 +304,11 @@ class LoadOrderHint(StrEnum):
     AFTER = "AFTER"
 
 
+_LOAD_ORDER_HINTS: dict[str, LoadOrderHint] = (
+    LoadOrderHint._value2member_map_
+)
+
+
 @dataclass(slots=True)
 class ManifestLoadHint:
     """Represents metadata for a load order hint for the mod.
@@ -224,21 +324,22 @@ class ManifestLoadHint:
     order: LoadOrderHint
 
     @classmethod
-    def from_json(cls, content: dict[str, str]) -> Self:
+    def from_json(
+        cls, content: dict[str, str], _orders=_LOAD_ORDER_HINTS
+    ) -> Self:
         """Creates a new instance of ManifestLoadHint from a JSON object.
 
         Args:
             content:
                 The JSON representation of the mod being hinted.
         """
-        id_: str = content["id"]
-        order: LoadOrderHint = LoadOrderHint(content["order"])
+        order = content["order"]
 
-        return cls(id_, order)
+        return cls(content["id"], _orders.get(order) or LoadOrderHint(order))
 
     def to_json(self) -> JsonValue:
         """Converts the object to a JSON object."""
-        return {"id": self.id, "order": str(self.order)}
+        return {"id": self.id, "order": self.order.value}
 
 
 @dataclass(slots=True)
@@ -255,7 +356,7 @@ class ManifestLoadFolder:
     """
 
     path: Path
-    game_version: str | None = field(default=None, init=False)
+    game_version: str | None = None
 
     @classmethod
     def from_json(cls, content: dict[str, str | bool]) -> Self:
@@ -265,26 +366,28 @@ class ManifestLoadFolder:
             content:
                 The JSON representation of the folder being loaded by the game.
         """
-        path: str = content["path"]
-        game_version: str | None = content.get("game_version", None)
-
-        folder = cls(Path(path))
+        return cls(Path(content["path"]), content.get("game_version", None))
 
-        if game_version:
-            folder.game_version = game_version
+    def to_json(self, _cwd: Path | None = None) -> JsonValue:
+        """Converts the object to a JSON object.
 
-        return folder
+        Args:
+            _cwd:
+                A precomputed value of Path.cwd() used to relativize the
+                folder's path. Callers serializing many folders, like
+                Manifest.to_json, pass it in so the getcwd syscall happens
+                once instead of once per folder.
+        """
+        path = os.fspath(self.path.relative_to(_cwd or Path.cwd()))
 
-    def to_json(self) -> JsonValue:
-        """Converts the object to a JSON object."""
         if self.game_version:
             return {
-                "path": str(self.path.relative_to(Path.cwd())),
+                "path": path,
                 "game_version": self.game_version,
             }
         else:
             return {
-                "path": str(self.path.relative_to(Path.cwd())),
+                "path": path,
             }
 
 
@@ -350,22 +453,18 @@ class Manifest:
     """
 
     name: str
-    id: str | None = field(default=None, init=False)
+    id: str | None = None
 
-    description: str | None = field(default=None, init=False)
-    version: str | None = field(default=None, init=False)
-    authors: list[str] = field(default_factory=list, init=False)
-    links: list[ManifestLink] = field(default_factory=list, init=False)
+    description: str | None = None
+    version: str | None = None
+    authors: list[str] = field(default_factory=list)
+    links: list[ManifestLink] = field(default_factory=list)
     supported_versions: list[ManifestSupportedVersion] = field(
-        default_factory=list, init=False
-    )
-    dependencies: list[ModDependency] = field(default_factory=list, init=False)
-    load_hints: list[ManifestLoadHint] = field(
-        default_factory=list, init=False
-    )
-    load_folders: list[ManifestLoadFolder] = field(
-        default_factory=list, init=False
+        default_factory=list
     )
+    dependencies: list[ModDependency] = field(default_factory=list)
+    load_hints: list[ManifestLoadHint] = field(default_factory=list)
+    load_folders: list[ManifestLoadFolder] = field(default_factory=list)
 
     @classmethod
     def from_json(cls, content: dict[str, JsonValue]) -> Self:
@@ -374,53 +473,83 @@ class Manifest:
         Args:
             content:
                 The JSON representation of the manifest.
+        Raises:
+            ManifestDecodeError:
+                The manifest was missing a required key, or one of its
+                values didn't match the expected shape.
         """
-        name: str = content["name"]
-        id_: str | None = content.get("id", None)
-        description: str | None = content.get("description", None)
-        version: str | None = content.get("version", None)
-        authors: list[str] = content.get("authors", [])
-
-        links: list[ManifestLink] = [
-            ManifestLink.from_json(obj) for obj in content.get("links", [])
-        ]
-
-        supported_versions: list[ManifestSupportedVersion] = [
-            ManifestSupportedVersion.from_json(obj)
-            for obj in content.get("supported_versions", [])
-        ]
-
-        dependencies: list[ModDependency] = [
-            ModDependency.from_json(obj)
-            for obj in content.get("dependencies", [])
-        ]
-
-        load_hints: list[ManifestLoadHint] = [
-            ManifestLoadHint.from_json(obj)
-            for obj in content.get("load_hints", None)
-        ]
-
-        load_folders: list[ManifestLoadFolder] = [
-            ManifestLoadFolder.from_json(obj)
-            for obj in content.get("load_folders", None)
-        ]
-
-        manifest = cls(name)
-        manifest.id = id_
-        manifest.description = description
-        manifest.version = version
-        manifest.authors = authors
-        manifest.links = links
-        manifest.supported_versions = supported_versions
-        manifest.dependencies = dependencies
-        manifest.load_hints = load_hints
-        manifest.load_folders = load_folders
-
-        return manifest
-
-    def to_json(self) -> JsonValue:
-        """Converts the object to a JSON object."""
-        container: dict[str, JsonValue] = {"name": self.name}
+        # Shape validation is left to the key lookups and constructors
+        # themselves — pre-checking every key would cost a pass over the
+        # document on every load to guard against the rare malformed file.
+        # The single handler below translates whatever they raise into one
+        # error type with a message that names the problem.
+        try:
+            name: str = content["name"]
+            id_: str | None = content.get("id", None)
+            description: str | None = content.get("description", None)
+            version: str | None = content.get("version", None)
+            authors: list[str] = content.get("authors", [])
+
+            # Binding the constructors to locals keeps the per-element cost
+            # of the comprehensions to a single call instead of a global
+            # load plus an attribute lookup for every entry.
+            link_from_json = ManifestLink.from_json
+            version_from_json = ManifestSupportedVersion.from_json
+            dependency_from_json = ModDependency.from_json
+            hint_from_json = ManifestLoadHint.from_json
+            folder_from_json = ManifestLoadFolder.from_json
+
+            links: list[ManifestLink] = [
+                link_from_json(obj) for obj in content.get("links", [])
+            ]
+
+            supported_versions: list[ManifestSupportedVersion] = [
+                version_from_json(obj)
+                for obj in content.get("supported_versions", [])
+            ]
+
+            dependencies: list[ModDependency] = [
+                dependency_from_json(obj)
+                for obj in content.get("dependencies", [])
+            ]
+
+            load_hints: list[ManifestLoadHint] = [
+                hint_from_json(obj) for obj in content.get("load_hints", [])
+            ]
+
+            load_folders: list[ManifestLoadFolder] = [
+                folder_from_json(obj)
+                for obj in content.get("load_folders", [])
+            ]
+        except KeyError as e:
+            raise ManifestDecodeError(
+                f"The manifest is missing the required '{e.args[0]}' key."
+            ) from e
+        except (TypeError, ValueError) as e:
+            raise ManifestDecodeError(
+                f"The manifest contains a malformed value: {e}"
+            ) from e
+
+        return cls(
+            name,
+            id_,
+            description,
+            version,
+            authors,
+            links,
+            supported_versions,
+            dependencies,
+            load_hints,
+            load_folders,
+        )
+
+    def _to_json_shallow(self) -> dict:
+        # The shared skeleton for to_json and json_default: the scalar
+        # fields converted, the child lists left holding the dataclass
+        # objects themselves. Load folders are the exception — their JSON
+        # form depends on the working directory, which is resolved once
+        # here rather than once per folder inside the orjson default hook.
+        container: dict = {"name": self.name}
 
         if self.id:
             container["id"] = self.id
@@ -431,7 +560,24 @@ class Manifest:
         if self.version:
             container["version"] = self.version
 
-        container["authors"] = [author for author in self.authors]
+        container["authors"] = self.authors
+        container["links"] = self.links
+        container["supported_versions"] = self.supported_versions
+        container["dependencies"] = self.dependencies
+        container["load_hints"] = self.load_hints
+
+        cwd = Path.cwd()
+
+        container["load_folders"] = [
+            folder.to_json(cwd) for folder in self.load_folders
+        ]
+
+        return container
+
+    def to_json(self) -> JsonValue:
+        """Converts the object to a JSON object."""
+        container = self._to_json_shallow()
+
         container["links"] = [link.to_json() for link in self.links]
 
         container["supported_versions"] = [
@@ -444,8 +590,50 @@ class Manifest:
 
         container["load_hints"] = [hint.to_json() for hint in self.load_hints]
 
-        container["load_folders"] = [
-            folder.to_json() for folder in self.load_folders
-        ]
-
         return container
+
+
+# The leaf manifest dataclasses whose JSON form comes from their
+# to_json method. Kept in one tuple so json_default dispatches them with
+# a single isinstance check; Manifest itself gets the shallow treatment.
+_JSON_CONVERTIBLE = (
+    ManifestLink,
+    ManifestSupportedVersion,
+    ModDependency,
+    ManifestLoadHint,
+    ManifestLoadFolder,
+)
+
+
+def json_default(value: object) -> JsonValue:
+    """Serializes manifest objects for orjson.dumps.
+
+    Passing this function as the `default` hook —
+
+        orjson.dumps(
+            manifest,
+            default=json_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
+    — lets callers dump a manifest straight to JSON bytes. The
+    passthrough option is required: without it orjson serializes
+    dataclasses itself from their raw fields and never consults this
+    hook. The manifest is handed to the encoder shallowly — its child
+    lists still hold the dataclass objects — so orjson walks the
+    structure once, asking for each child's JSON form as it reaches it,
+    instead of the caller materializing the entire to_json dict tree up
+    front and having the encoder traverse the same data a second time.
+    """
+    if isinstance(value, Manifest):
+        return value._to_json_shallow()
+
+    if isinstance(value, _JSON_CONVERTIBLE):
+        return value.to_json()
+
+    if isinstance(value, Path):
+        return str(value)
+
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
@@ -0,0 +1,12 @@
+__all__ = [
+    "ManifestError",
+    "ManifestDecodeError",
+]
+
+
+class ManifestError(Exception):
+    """Base exception class for manifest exceptions."""
+
+
+class ManifestDecodeError(ManifestError):
+    """Exception raised when a manifest file couldn't be decoded."""
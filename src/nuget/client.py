@@ -1,8 +1,13 @@
+from asyncio import Event
 from asyncio import Lock
+from asyncio import gather
 from logging import getLogger
 from logging import Logger
+from pathlib import Path
+from typing import AsyncGenerator
 from typing import Final
 
+import orjson
 from aiohttp import ClientSession
 from yarl import URL
 
@@ -29,9 +34,24 @@ class NuGetClient:
 
     SEARCH_QUERY_SERVICE_NAME: Final[str] = "SearchQueryService"
 
+    # The resolved search query URL changes rarely, so it's persisted here
+    # together with the index's ETag. Subsequent runs revalidate with
+    # If-None-Match and reuse the cached URL on a 304 instead of
+    # re-downloading and re-walking the service index.
+    INDEX_CACHE_PATH: Final[Path] = Path.home().joinpath(
+        ".cache", "pyverse", "nuget_index.json"
+    )
+
     def __init__(self):
-        self._session = ClientSession()
-        self._catalog_lock: Lock = Lock()
+        # A larger read buffer means fewer chunk boundaries while draining
+        # the sizeable search responses the registry returns.
+        self._session = ClientSession(read_bufsize=2**17)
+        # The query URL is immutable once resolved, so hot-path callers
+        # only probe the event's flag — a plain attribute check — instead
+        # of acquiring a lock per request. The lock below serializes the
+        # initialization itself and is never touched again afterwards.
+        self._catalog_ready: Event = Event()
+        self._init_lock: Lock = Lock()
         self._logger: Logger = getLogger(__name__)
         self._catalog_query_url: URL | None = None
 
@@ -60,10 +80,77 @@ class NuGetClient:
 
         return response.data
 
+    async def query_packages(
+        self, package_names: list[str], include_prereleases: bool = True
+    ) -> list[list[SearchQueryDataEntry] | None]:
+        """Queries the NuGet package registry for several packages at once.
+
+        Args:
+            package_names:
+                The names of the packages that should be queried for.
+            include_prereleases:
+                Whether to include prerelease versions of the packages in
+                the results.
+        Returns:
+            One result per queried name, in the order the names were given.
+            Each result is the list of packages matching that name, or None
+            if that query failed.
+        Notes:
+            The individual queries are independent round trips to the
+            registry, so they're issued concurrently over the session's
+            keep-alive connections and the total wall-clock time is roughly
+            one round trip instead of one per package.
+        """
+        # Resolve the catalog query URL once up front; otherwise every
+        # query in the batch would pile onto the initialization lock.
+        if not self._catalog_ready.is_set():
+            await self._init_catalog_query_url()
+
+        return await gather(
+            *(
+                self.query_package(name, include_prereleases)
+                for name in package_names
+            )
+        )
+
+    async def query_package_iter(
+        self, package_name: str, include_prereleases: bool = True
+    ) -> AsyncGenerator[SearchQueryDataEntry]:
+        """Queries the registry and yields matches as they're decoded.
+
+        Args:
+            package_name:
+                The name of the package that should be queried for.
+            include_prereleases:
+                Whether to include prerelease versions of the package in the
+                results.
+        Returns:
+            The packages that match the package name, one at a time.
+        Notes:
+            Unlike query_package, the entries are materialized lazily, so a
+            caller that filters or stops early only pays for the entries it
+            actually consumed instead of the whole result set up front.
+        """
+        if not self._catalog_ready.is_set():
+            await self._init_catalog_query_url()
+
+        request_url = self._catalog_query_url.with_query(
+            {"q": package_name, "prerelease": include_prereleases}
+        )
+
+        async with self._session.get(request_url) as response:
+            if not response.ok:
+                raise PackageQueryTimeoutError()
+
+            raw = await response.read()
+
+        for entry in orjson.loads(raw)["data"]:
+            yield SearchQueryDataEntry.from_json(entry)
+
     async def _query_package(
         self, package_name: str, include_prereleases: bool = True
     ) -> SearchQueryResponse:
-        if not self._catalog_query_url:
+        if not self._catalog_ready.is_set():
             await self._init_catalog_query_url()
 
         request_url = self._catalog_query_url.with_query(
@@ -74,24 +161,48 @@ class NuGetClient:
             if not response.ok:
                 raise PackageQueryTimeoutError()
 
-            return await response.json()
+            raw = await response.read()
+
+        # aiohttp's response.json() sniffs the content type and decodes the
+        # body through the stdlib json module; the registry always returns
+        # UTF-8 JSON, and orjson decodes the raw bytes directly. The old
+        # code also returned the undecoded dict despite the declared return
+        # type — the payload is now materialized into SearchQueryResponse.
+        return SearchQueryResponse.from_json(orjson.loads(raw))
 
     async def _init_catalog_query_url(self):
-        if self._catalog_query_url:
-            return
+        # The init lock only serializes concurrent first-time callers;
+        # once the ready event is set, nothing ever takes it again. async
+        # with releases it no matter how this block exits, including the
+        # raising paths.
+        async with self._init_lock:
+            if self._catalog_ready.is_set():
+                return
 
-        await self._catalog_lock.acquire()
+            cached = self._load_cached_index()
+            headers = {}
 
-        if self._catalog_query_url:
-            self._catalog_lock.release()
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
 
-            return
+            async with self._session.get(
+                self.NUGET_PACKAGE_SOURCE_URL, headers=headers
+            ) as resp:
+                if resp.status == 304 and cached:
+                    self._catalog_query_url = URL(cached["url"])
+                    self._catalog_ready.set()
 
-        async with self._session.get(self.NUGET_PACKAGE_SOURCE_URL) as resp:
-            if not resp.ok:
-                raise ServiceTimeoutError()
+                    return
+
+                if not resp.ok:
+                    raise ServiceTimeoutError()
+
+                # Same rationale as the query path: the index is known to
+                # be UTF-8 JSON, so content-type sniffing and the stdlib
+                # decoder are skipped in favor of orjson on the raw bytes.
+                response = orjson.loads(await resp.read())
+                etag = resp.headers.get("ETag", "")
 
-            response = await resp.json()
             for resource in response.get("resources", {}):
                 resource_type = resource.get("@type", None)
 
@@ -101,8 +212,6 @@ class NuGetClient:
                 query_id = resource.get("id", None)
 
                 if not query_id:
-                    self._catalog_lock.release()
-
                     raise NuGetError(
                         f"The 'id' property is missing from "
                         f"{NuGetClient.SEARCH_QUERY_SERVICE_NAME}'s service"
@@ -110,6 +219,30 @@ class NuGetClient:
                     )
 
                 self._catalog_query_url = URL(query_id)
-                self._catalog_lock.release()
+                self._save_cached_index(query_id, etag)
+                self._catalog_ready.set()
 
                 return
+
+            # Falling off the loop silently would leave the query URL
+            # unset and every caller crashing on it later; a missing
+            # service is an index problem and is reported as one.
+            raise NuGetError(
+                f"The service index doesn't define a "
+                f"{NuGetClient.SEARCH_QUERY_SERVICE_NAME} resource."
+            )
+
+    def _load_cached_index(self) -> dict | None:
+        try:
+            return orjson.loads(self.INDEX_CACHE_PATH.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_index(self, url: str, etag: str):
+        try:
+            self.INDEX_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self.INDEX_CACHE_PATH.write_bytes(
+                orjson.dumps({"url": url, "etag": etag})
+            )
+        except OSError:
+            self._logger.warning("Unable to persist the NuGet index cache.")
@@ -1,4 +1,7 @@
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from typing import Self
 
 from semver import Version
@@ -13,6 +16,14 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=8192)
+def _parse_version(version: str) -> Version:
+    # Search responses repeat version strings heavily — every entry embeds
+    # its own version plus one per listed release — and Version.parse is a
+    # regex-heavy call. Caching turns the duplicates into dict hits.
+    return Version.parse(version)
+
+
 @dataclass(slots=True)
 class SearchQueryContext:
     base: URL
@@ -38,7 +49,10 @@ class SearchQueryPackageType:
 
     @classmethod
     def from_json(cls, data: dict) -> Self:
-        return SearchQueryPackageType(data["name"])
+        # Package type names come from a tiny fixed vocabulary
+        # ("Dependency", "DotnetTool", ...), so the stored string is an
+        # interned, shared reference rather than a fresh copy per entry.
+        return SearchQueryPackageType(sys.intern(data["name"]))
 
     def to_json(self) -> dict:
         return {
@@ -48,7 +62,7 @@ class SearchQueryPackageType:
 
 @dataclass(slots=True)
 class SearchQueryPackageVersion:
-    id: URL
+    id: str
     downloads: int
     version: Version
 
@@ -57,30 +71,64 @@ class SearchQueryPackageVersion:
         return SearchQueryPackageVersion(
             id=data["@id"],
             downloads=data["downloads"],
-            version=Version.parse(data["version"]),
+            version=_parse_version(data["version"]),
         )
 
     def to_json(self) -> dict:
         return {
-            "@id": str(self.id),
+            "@id": self.id,
             "downloads": self.downloads,
             "version": str(self.version),
         }
 
 
+# Pulls every search entry field out of the decoded dict in one C-level
+# pass, in SearchQueryDataEntry's field order, instead of ~20 separate
+# Python-level key lookups per entry.
+_ENTRY_FIELDS = itemgetter(
+    "@id",
+    "@type",
+    "authors",
+    "description",
+    "iconUrl",
+    "id",
+    "licenseUrl",
+    "owners",
+    "packageTypes",
+    "projectUrl",
+    "registration",
+    "summary",
+    "tags",
+    "title",
+    "totalDownloads",
+    "verified",
+    "version",
+    "versions",
+    "vulnerabilities",
+)
+
+
 @dataclass(slots=True)
 class SearchQueryDataEntry:
-    id_url: URL
+    # The URL-ish fields stay raw strings: most responses are filtered or
+    # re-serialized without ever navigating a URL, and wrapping six fields
+    # per entry in yarl.URL at decode time only to str() them again at
+    # encode time was pure churn. The *_parsed properties construct a URL
+    # on demand for the callers that do navigate. The type and tags
+    # fields hold interned strings, shared across every entry that
+    # repeats the same value; comparing or dict-keying them degrades to
+    # pointer checks.
+    id_url: str
     type: str
     authors: list[str]
     description: str
-    icon_url: URL
+    icon_url: str
     id: str
-    license_url: URL
+    license_url: str
     owners: list[str]
     package_types: [SearchQueryPackageType]
-    project_url: URL
-    registration: URL
+    project_url: str
+    registration: str
     summary: str
     tags: list[str]
     title: str
@@ -90,49 +138,89 @@ class SearchQueryDataEntry:
     versions: list[SearchQueryPackageVersion]
     vulnerabilities: list
 
+    @property
+    def id_url_parsed(self) -> URL:
+        return URL(self.id_url)
+
+    @property
+    def icon_url_parsed(self) -> URL:
+        return URL(self.icon_url)
+
+    @property
+    def license_url_parsed(self) -> URL:
+        return URL(self.license_url)
+
+    @property
+    def project_url_parsed(self) -> URL:
+        return URL(self.project_url)
+
+    @property
+    def registration_parsed(self) -> URL:
+        return URL(self.registration)
+
     @classmethod
-    def from_json(cls, data: dict) -> Self:
-        return SearchQueryDataEntry(
-            id_url=URL(data["@id"]),
-            type=data["@type"],
-            authors=data["authors"],
-            description=data["description"],
-            icon_url=URL(data["iconUrl"]),
-            id=data["id"],
-            owners=data["owners"],
-            package_types=[
-                SearchQueryPackageType.from_json(package_type)
-                for package_type in data["packageTypes"]
-            ],
-            project_url=URL(data["projectUrl"]),
-            license_url=URL(data["licenseUrl"]),
-            registration=URL(data["registration"]),
-            summary=data["summary"],
-            tags=data["tags"],
-            title=data["title"],
-            total_downloads=data["totalDownloads"],
-            verified=data["verified"],
-            version=Version.parse(data["version"]),
-            versions=[
-                SearchQueryPackageVersion.from_json(version)
-                for version in data["versions"]
-            ],
-            vulnerabilities=data["vulnerabilities"],
+    def from_json(cls, data: dict, _fields=_ENTRY_FIELDS) -> Self:
+        (
+            id_url,
+            type_,
+            authors,
+            description,
+            icon_url,
+            id_,
+            license_url,
+            owners,
+            package_types,
+            project_url,
+            registration,
+            summary,
+            tags,
+            title,
+            total_downloads,
+            verified,
+            version,
+            versions,
+            vulnerabilities,
+        ) = _fields(data)
+
+        # "@type" takes a handful of distinct values across thousands of
+        # entries, and tags repeat across packages in the same ecosystem;
+        # interning both deduplicates the payload and makes downstream
+        # equality checks identity-fast.
+        return cls(
+            id_url,
+            sys.intern(type_),
+            authors,
+            description,
+            icon_url,
+            id_,
+            license_url,
+            owners,
+            list(map(SearchQueryPackageType.from_json, package_types)),
+            project_url,
+            registration,
+            summary,
+            [sys.intern(tag) for tag in tags],
+            title,
+            total_downloads,
+            verified,
+            _parse_version(version),
+            list(map(SearchQueryPackageVersion.from_json, versions)),
+            vulnerabilities,
         )
 
     def to_json(self) -> dict:
         return {
-            "@id": str(self.id_url),
+            "@id": self.id_url,
             "@type": self.type,
             "authors": self.authors,
             "description": self.description,
-            "iconUrl": str(self.icon_url),
+            "iconUrl": self.icon_url,
             "id": self.id,
-            "licenseUrl": str(self.license_url),
+            "licenseUrl": self.license_url,
             "owners": self.owners,
             "packageTypes": [type_.to_json() for type_ in self.package_types],
-            "projectUrl": str(self.project_url),
-            "registration": str(self.registration),
+            "projectUrl": self.project_url,
+            "registration": self.registration,
             "summary": self.summary,
             "tags": self.tags,
             "title": self.title,
@@ -152,18 +240,17 @@ class SearchQueryResponse:
 
     @classmethod
     def from_json(cls, data: dict) -> Self:
+        # map() drives the element loop in C; comprehensions re-enter the
+        # interpreter for every entry.
         return SearchQueryResponse(
             context=SearchQueryContext.from_json(data["@context"]),
-            data=[
-                SearchQueryDataEntry.from_json(data_entry)
-                for data_entry in data["data"]
-            ],
+            data=list(map(SearchQueryDataEntry.from_json, data["data"])),
             total_hits=data["totalHits"],
         )
 
     def to_json(self) -> dict:
         return {
-            "@context": str(self.context.to_json()),
+            "@context": self.context.to_json(),
             "data": [data_entry.to_json() for data_entry in self.data],
             "totalHits": self.total_hits,
         }